@@ -1,8 +1,509 @@
 import math
 import sqlite3
+import threading
+from functools import lru_cache
+from collections import namedtuple
+from dataclasses import dataclass
+from math import isclose, isfinite
+from operator import itemgetter
+
+import numpy as np
 import pandas as pd
 from welleng.architecture import String
-from typing import Optional, Dict, Any, Union, Literal, NoReturn, List
+from typing import Optional, Dict, Any, Union, Literal, NamedTuple, NoReturn, List, Final, Tuple
+
+try:
+    from numba import njit, prange, vectorize
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    njit = None
+    prange = range
+    vectorize = None
+
+# Below this many sections the thread-team startup cost of a parallel kernel
+# outweighs the work; typical wellbores (3-6 sections) stay on the serial path
+_PARALLEL_SECTION_THRESHOLD = 8
+
+# Conversion from mud weight in ppg to hydrostatic gradient in psi/ft;
+# a typed module-level constant so JIT/AOT backends can fold it inline
+_PPG_TO_PSI_FT: Final[float] = 0.05194806
+
+# Read-only URI for the bundled casing catalog; the connection is opened
+# lazily, tuned once and then reused so repeat main() invocations skip the
+# file-open/page-cache warmup cost
+_DB_URI = 'file:sample_casing.db?mode=ro'
+_DB_CONN: Optional[sqlite3.Connection] = None
+_DB_CONN_LOCK = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Returns the shared read-only catalog connection, opening it once.
+
+    Double-checked locking keeps the common path to a single global read;
+    check_same_thread=False is safe because the connection only ever serves
+    reads and the pragmas are applied under the lock before it is shared.
+    """
+    global _DB_CONN
+    if _DB_CONN is None:
+        with _DB_CONN_LOCK:
+            if _DB_CONN is None:
+                conn = sqlite3.connect(
+                    _DB_URI, uri=True, check_same_thread=False
+                )
+                conn.executescript(
+                    'PRAGMA synchronous=OFF;'
+                    'PRAGMA temp_store=MEMORY;'
+                    'PRAGMA mmap_size=268435456;'
+                    'PRAGMA cache_size=-65536;'
+                )
+                _DB_CONN = conn
+    return _DB_CONN
+
+
+# Single C-level bulk getter for the casing fields CasingDataCalc consumes,
+# replacing twenty separate keyed lookups per instantiation
+_CASING_FIELDS_GETTER = itemgetter(
+    'tvd', 'washout', 'int_gradient', 'mud_weight', 'backup_mud',
+    'cement_cu_ft', 'hole_size', 'bottom', 'top', 'weight', 'od', 'grade',
+    'connection', 'body_yield', 'burst_strength', 'wall_thickness',
+    'csg_internal_diameter', 'collapse_pressure', 'tension_strength'
+)
+
+# Geometric and pressure constants, hoisted so they are evaluated once and
+# can be folded inline by the JIT paths
+_PI_OVER_4: Final[float] = math.pi / 4
+_INCH2_TO_FT2: Final[float] = 1 / 144.0
+_MUD_CONV_PSI_FT: Final[float] = 0.052          # simplified ppg -> psi/ft
+_ANNULAR_CAPACITY_FACTOR: Final[float] = 183.35  # in^2 -> ft^3/ft capacity
+_FRESH_WATER_EQ_PPG: Final[float] = 65.4         # steel buoyancy reference
+_PORE_PRESSURE_GRADIENT: Final[float] = 0.465    # psi/ft default pore grad
+
+
+def _maybe_jit(func):
+    """Applies numba's njit decorator when numba is installed.
+
+    Keeps the module importable without numba: the undecorated pure-Python
+    function is used as-is, while installations with numba get an
+    LLVM-compiled kernel with on-disk caching.
+
+    Args:
+        func: Pure scalar function suitable for nopython compilation.
+
+    Returns:
+        The jitted function when numba is available, otherwise func unchanged.
+    """
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+def _maybe_jit_parallel(func):
+    """Applies njit(parallel=True) when numba is installed.
+
+    Like _maybe_jit but compiles the prange loop to a multi-threaded kernel;
+    without numba the function runs serially with prange aliased to range.
+
+    Args:
+        func: Array-in/array-out function with a prange loop.
+
+    Returns:
+        The jitted function when numba is available, otherwise func unchanged.
+    """
+    if njit is None:
+        return func
+    return njit(parallel=True, cache=True, fastmath=True)(func)
+
+
+@_maybe_jit_parallel
+def _pair_maps_burst_batch(mw, bm, tvd, fip, ig, bs,
+                           maps_out, burst_out, df_out):
+    """Parallel batch kernel for adjacent-pair maps/burst/design-factor math.
+
+    Computes the same per-pair quantities as the vectorized NumPy pass in
+    calcParametersContained, but distributes iterations across threads via
+    prange; used for wellbores with many sections where the thread-team
+    startup cost is amortized.
+
+    Args:
+        mw, bm, tvd, fip, ig, bs: 1-D float64 input arrays over all sections
+            (mud weight, backup mud, tvd, frac init pressure, internal
+            gradient, burst strength).
+        maps_out, burst_out, df_out: Preallocated 1-D float64 output arrays
+            of length n - 1, filled in place.
+    """
+    ppg = _PPG_TO_PSI_FT
+    for i in prange(mw.shape[0] - 1):
+        next_bhp = mw[i + 1] * tvd[i + 1] * ppg
+        maps = next_bhp - (tvd[i + 1] - tvd[i]) * ig[i + 1]
+        hydro_bm = ppg * bm[i] * tvd[i]
+        part1 = ppg * (mw[i] - bm[i]) * tvd[i]
+        burst = max(part1, min(fip[i] - hydro_bm, maps - hydro_bm))
+        maps_out[i] = maps
+        burst_out[i] = burst
+        df_out[i] = bs[i] / burst if burst > 0 else np.inf
+
+
+@_maybe_jit
+def _solo_maps_burst(mw: float, bm: float, tvd: float, fip: float,
+                     bs: float, hydro_mw: float, hydro_bm: float) -> tuple:
+    """Scalar kernel behind calculateSoloMapsBurstLoadDF.
+
+    Takes plain floats (no dict unpacking) so numba can compile it to
+    straight-line FP code. The hydrostatic mud products are passed in so
+    values cached at section-add time are reused rather than recomputed.
+
+    Args:
+        mw: Mud weight in ppg.
+        bm: Backup mud weight in ppg.
+        tvd: True vertical depth in feet.
+        fip: Formation fracture initiation pressure in psi.
+        bs: Casing burst strength rating in psi.
+        hydro_mw: Hydrostatic mud-weight pressure (0.05194806*mw*tvd) in psi.
+        hydro_bm: Hydrostatic backup-mud pressure (0.05194806*bm*tvd) in psi.
+
+    Returns:
+        tuple: (maps, burst_load, burst_df) in psi / psi / dimensionless.
+    """
+    ppg = _PPG_TO_PSI_FT
+    maps = hydro_mw
+    burst_load = max(
+        ppg * (mw - bm) * tvd,
+        min(fip - hydro_bm, maps - hydro_bm)
+    )
+    burst_df = bs / burst_load if burst_load > 0 else np.inf
+    return maps, burst_load, burst_df
+
+
+@_maybe_jit
+def _calc_maps(next_bhp: float, tvd2: float, tvd1: float, ig2: float) -> float:
+    """Scalar kernel behind calculate_maps.
+
+    Args:
+        next_bhp: Lower section hydrostatic bottomhole pressure in psi.
+        tvd2: Lower section true vertical depth in feet.
+        tvd1: Upper section true vertical depth in feet.
+        ig2: Lower section internal pressure gradient in psi/ft.
+
+    Returns:
+        float: Maximum Anticipated Pressure at Shoe in psi.
+    """
+    return next_bhp - (tvd2 - tvd1) * ig2
+
+
+@_maybe_jit
+def _calc_burst_load(mw1: float, bm1: float, tvd1: float, fip1: float,
+                     maps: float, hydro_bm: float) -> float:
+    """Scalar kernel behind calculate_burst_load.
+
+    Args:
+        mw1: Upper section mud weight in ppg.
+        bm1: Upper section backup mud weight in ppg.
+        tvd1: Upper section true vertical depth in feet.
+        fip1: Upper section fracture initiation pressure in psi.
+        maps: Maximum anticipated pressure at shoe in psi.
+        hydro_bm: Hydrostatic backup-mud pressure (0.05194806*bm1*tvd1) in psi.
+
+    Returns:
+        float: Maximum burst load in psi.
+    """
+    ppg = _PPG_TO_PSI_FT
+    part1 = ppg * (mw1 - bm1) * tvd1
+    return max(part1, min(fip1 - hydro_bm, maps - hydro_bm))
+
+
+# Prefer the Cython-compiled kernels (see casingcalc_kernels.pyx) when the
+# extension has been built; they avoid numba's first-call JIT latency while
+# computing the exact same formulas
+try:
+    from casingcalc_kernels import (
+        solo_maps_burst as _solo_maps_burst,
+        calc_maps as _calc_maps,
+        calc_burst_load as _calc_burst_load,
+    )
+except ImportError:  # pragma: no cover - extension is an optional accelerator
+    pass
+
+# AOT-compiled scalar battery (see build_aot.py): loads with no JIT warmup.
+# Bound to a separate name because the njit batch kernel must keep calling
+# the jitted _calc_all internally.
+try:
+    from _casing_kernel import calc_all as _calc_all_aot
+except ImportError:  # pragma: no cover - extension is an optional accelerator
+    _calc_all_aot = None
+
+
+if vectorize is not None:
+    @vectorize(
+        ['float64(float64, float64, float64, float64, float64)'],
+        target='parallel'
+    )
+    def _solo_burst_df_ufunc(mw, bm, tvd, fip, bs):
+        """Elementwise solo burst design factor (see _solo_maps_burst)."""
+        ppg = 0.05194806
+        hydro_mw = ppg * mw * tvd
+        hydro_bm = ppg * bm * tvd
+        burst_load = max(
+            ppg * (mw - bm) * tvd,
+            min(fip - hydro_bm, hydro_mw - hydro_bm)
+        )
+        return bs / burst_load if burst_load > 0 else np.inf
+else:  # pragma: no cover - numba is an optional accelerator
+    _solo_burst_df_ufunc = None
+
+
+def sweep_burst_df(mw_arr, bm_arr, tvd_arr, fip_arr, bs_arr) -> np.ndarray:
+    """Computes solo burst design factors for a whole parameter sweep at once.
+
+    Broadcasts the standalone-section burst math over parallel arrays of
+    trial parameters, letting Monte-Carlo and sensitivity studies evaluate
+    thousands of realizations without a Python-level per-sample loop. With
+    numba installed the work runs as a compiled multi-threaded ufunc;
+    otherwise an equivalent vectorized NumPy pass is used.
+
+    Args:
+        mw_arr: Mud weights in ppg.
+        bm_arr: Backup mud weights in ppg.
+        tvd_arr: True vertical depths in feet.
+        fip_arr: Formation fracture initiation pressures in psi.
+        bs_arr: Casing burst strength ratings in psi.
+
+    Returns:
+        np.ndarray: Burst design factors, broadcast over the inputs, with
+            inf where the computed burst load is non-positive.
+
+    Example:
+        >>> dfs = sweep_burst_df(mw, bm, tvd, fip, bs)
+        >>> dfs.shape == mw.shape
+        True
+    """
+    if _solo_burst_df_ufunc is not None:
+        return _solo_burst_df_ufunc(mw_arr, bm_arr, tvd_arr, fip_arr, bs_arr)
+
+    # NumPy fallback mirroring the ufunc formulas
+    mw = np.asarray(mw_arr, dtype=np.float64)
+    bm = np.asarray(bm_arr, dtype=np.float64)
+    tvd = np.asarray(tvd_arr, dtype=np.float64)
+    fip = np.asarray(fip_arr, dtype=np.float64)
+    bs = np.asarray(bs_arr, dtype=np.float64)
+
+    hydro_mw = _PPG_TO_PSI_FT * mw * tvd
+    hydro_bm = _PPG_TO_PSI_FT * bm * tvd
+    burst_load = np.maximum(
+        _PPG_TO_PSI_FT * (mw - bm) * tvd,
+        np.minimum(fip - hydro_bm, hydro_mw - hydro_bm)
+    )
+    positive = burst_load > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(
+            positive,
+            bs / np.where(positive, burst_load, 1.0),
+            np.inf
+        )
+
+
+@_maybe_jit
+def _calc_all(tvd: float, washout: float, int_gradient: float,
+              mud_weight: float, cement_cu_ft: float, hole_size: float,
+              set_depth: float, csg_weight: float, csg_size: float,
+              csg_id: float, collapse_strength: float,
+              tension_strength: float, tol: float, frac_gradient: float,
+              max_md_depth: float, max_tvd_depth: float) -> tuple:
+    """Scalar kernel computing the full CasingDataCalc battery for one casing.
+
+    Pure float arithmetic with no object access, mirroring the individual
+    calculate_* methods exactly, so numba can compile it to native code.
+
+    Args:
+        tvd, washout, int_gradient, mud_weight, cement_cu_ft, hole_size,
+        set_depth, csg_weight, csg_size, csg_id, collapse_strength,
+        tension_strength: Per-casing properties (see CasingDataCalc).
+        tol, frac_gradient, max_md_depth, max_tvd_depth: Wellbore-level
+            universal parameters.
+
+    Returns:
+        tuple: (frac_init_pressure, annular_volume, cmt_height, toc, masp,
+            collapse_load, collapse_df, neutral_point, tension_air,
+            tension_buoyed, tension_df)
+    """
+    frac_init_pressure = frac_gradient * tvd
+
+    # Annular volume per foot (open hole minus casing OD area)
+    annular_volume = (
+        _PI_OVER_4 * _INCH2_TO_FT2
+        * (hole_size * hole_size - csg_size * csg_size)
+    )
+
+    # Cement column height with washout-adjusted hole size
+    if csg_size > 0:
+        effective_hole_size = hole_size * (1 + washout / 100)
+        annular_volume_per_foot = (
+            effective_hole_size * effective_hole_size - csg_size * csg_size
+        ) / _ANNULAR_CAPACITY_FACTOR
+        cmt_height = (1 / annular_volume_per_foot) * cement_cu_ft
+    else:
+        cmt_height = 0.0
+
+    # Top of cement, clamped at surface
+    toc = set_depth - cmt_height
+    if toc < 0:
+        toc = 0.0
+
+    # Maximum anticipated surface pressure; tvd is factored out of the
+    # three differential terms so only one multiply survives the max
+    masp = tvd * max(0.0, max(
+        _PORE_PRESSURE_GRADIENT - int_gradient,
+        _PPG_TO_PSI_FT * mud_weight - int_gradient
+    ))
+
+    # Collapse load (empty casing worst case) and design factor
+    collapse_load = set_depth * mud_weight * _MUD_CONV_PSI_FT
+    collapse_df = (
+        collapse_strength / collapse_load if collapse_load != 0 else np.inf
+    )
+
+    # Neutral point from buoyancy
+    neutral_point = tvd * (1 - mud_weight / _FRESH_WATER_EQ_PPG)
+
+    # Tension: tol adjustment applies when set at max measured depth
+    if set_depth == max_md_depth:
+        total_weight = csg_weight * abs(set_depth - tol)
+        buoy_tvd = abs(tvd - max_tvd_depth)
+    else:
+        total_weight = csg_weight * set_depth
+        buoy_tvd = tvd
+    tension_air = total_weight * 1e-3
+
+    steel_area = _PI_OVER_4 * (csg_size * csg_size - csg_id * csg_id)
+    tension_buoyed = (
+        total_weight - _PPG_TO_PSI_FT * mud_weight * buoy_tvd * steel_area
+    ) * 1e-3
+    tension_df = (
+        tension_strength / tension_buoyed if tension_buoyed != 0 else np.inf
+    )
+
+    return (frac_init_pressure, annular_volume, cmt_height, toc, masp,
+            collapse_load, collapse_df, neutral_point, tension_air,
+            tension_buoyed, tension_df)
+
+
+@_maybe_jit_parallel
+def _calc_all_batch(tvd, washout, int_gradient, mud_weight, cement_cu_ft,
+                    hole_size, set_depth, csg_weight, csg_size, csg_id,
+                    collapse_strength, tension_strength, tol, frac_gradient,
+                    max_md_depth, max_tvd_depth, out):
+    """Parallel batch form of _calc_all over arrays of casings.
+
+    Runs the scalar kernel for every casing across threads via prange
+    (serially without numba), writing results into a preallocated (11, n)
+    output array whose rows follow the _calc_all return order.
+
+    Args:
+        tvd ... tension_strength: 1-D float64 per-casing input arrays.
+        tol, frac_gradient, max_md_depth, max_tvd_depth: Scalar wellbore
+            universals.
+        out: Preallocated (11, n) float64 array, filled in place.
+    """
+    for i in prange(tvd.shape[0]):
+        (out[0, i], out[1, i], out[2, i], out[3, i], out[4, i], out[5, i],
+         out[6, i], out[7, i], out[8, i], out[9, i], out[10, i]) = _calc_all(
+            tvd[i], washout[i], int_gradient[i], mud_weight[i],
+            cement_cu_ft[i], hole_size[i], set_depth[i], csg_weight[i],
+            csg_size[i], csg_id[i], collapse_strength[i],
+            tension_strength[i], tol, frac_gradient, max_md_depth,
+            max_tvd_depth
+        )
+
+
+def make_specialized_kernel(casing_spec: Dict[str, Any],
+                            univ_params: 'UnivParams'):
+    """Builds a battery kernel specialized to one casing specification.
+
+    Design-optimization sweeps evaluate the same (grade, connection, od,
+    weight) spec thousands of times while varying only the placement
+    inputs. The returned callable closes over every spec-level constant -
+    geometry, strengths, cement volume and the wellbore universals - so
+    under numba the closure cells become compile-time constants that LLVM
+    folds into the generated code, leaving only the per-iteration inputs
+    live. Without numba the closure still skips re-reading the spec dict
+    on every call.
+
+    Args:
+        casing_spec: Mapping with the fixed casing fields (washout,
+            int_gradient, cement_cu_ft, hole_size, weight, od,
+            csg_internal_diameter, collapse_pressure, tension_strength).
+        univ_params: Wellbore-level parameters (UnivParams namedtuple or
+            dict).
+
+    Returns:
+        callable: kernel(tvd, mud_weight, set_depth) returning the same
+        11-tuple as the module-level _calc_all battery.
+
+    Example:
+        >>> kernel = make_specialized_kernel(spec, univ_params)
+        >>> for tvd in candidate_tvds:
+        ...     results = kernel(tvd, 11.0, tvd + 250.0)
+    """
+    if isinstance(univ_params, dict):
+        univ_params = UnivParams(**univ_params)
+    washout = float(casing_spec['washout'])
+    int_gradient = float(casing_spec['int_gradient'])
+    cement_cu_ft = float(casing_spec['cement_cu_ft'])
+    hole_size = float(casing_spec['hole_size'])
+    csg_weight = float(casing_spec['weight'])
+    csg_size = float(casing_spec['od'])
+    csg_id = float(casing_spec['csg_internal_diameter'])
+    collapse_strength = float(casing_spec['collapse_pressure'])
+    tension_strength = float(casing_spec['tension_strength'])
+    max_md_depth, max_tvd_depth, tol, frac_gradient = map(
+        float, univ_params
+    )
+
+    def kernel(tvd: float, mud_weight: float, set_depth: float) -> tuple:
+        return _calc_all(
+            tvd, washout, int_gradient, mud_weight, cement_cu_ft,
+            hole_size, set_depth, csg_weight, csg_size, csg_id,
+            collapse_strength, tension_strength, tol, frac_gradient,
+            max_md_depth, max_tvd_depth
+        )
+
+    if njit is not None:
+        # Closure cells are frozen into the compiled code; caching is not
+        # available for closures, but the compile is amortized over the sweep
+        kernel = njit(fastmath=True)(kernel)
+    return kernel
+
+
+# Wellbore-level parameters shared by every per-section calculation; a
+# namedtuple gives C-struct-like field access instead of per-call dict lookups
+UnivParams = namedtuple(
+    'UnivParams',
+    'max_md_depth max_tvd_depth tol frac_gradient'
+)
+
+
+class CasingResults(NamedTuple):
+    """Per-casing calculation results as one contiguous immutable struct.
+
+    Replaces the 14-key dict calculateData used to build per casing: field
+    access is an index into a tuple rather than a hash lookup, and
+    construction avoids allocating a hash table. Dict-style consumers can
+    still get a mapping via ._asdict().
+    """
+
+    cement_cu_ft: float
+    cement_height: float
+    toc: float
+    masp: float
+    collapse_strength: float
+    collapse_load: float
+    collapse_df: float
+    burst_strength: float
+    neutral_point: float
+    tension_strength: float
+    tension_df: float
+    tension_air: float
+    tension_buoyed: float
+    frac_init_pressure: float
+
 
 def calculateSoloMapsBurstLoadDF(section: Dict[str, Union[float, int]]) -> Dict[str, Union[float, int]]:
     """Calculates Maximum Anticipated Surface Pressure (MAPS), burst load, and burst design
@@ -52,24 +553,29 @@ def calculateSoloMapsBurstLoadDF(section: Dict[str, Union[float, int]]) -> Dict[
         >>> print(f"MAPS: {updated['maps']:.0f} psi")
         MAPS: 7792 psi
     """
-    # Calculate Maximum Anticipated Surface Pressure
-    maps = section['mud_weight'] * section['tvd'] * 0.05194806
-
-    # Calculate burst load considering multiple pressure scenarios
-    burst_load = max(
-        # Differential pressure from mud weights
-        (0.05194806 * (section['mud_weight'] - section['backup_mud']) * section['tvd']),
-        # Minimum of fracture pressure and MAPS effects
-        min(
-            (section['frac_init_pressure'] - (0.05194806 * section['backup_mud'] * section['tvd'])),
-            maps - section['int_gradient'] * (section['tvd'] - section['tvd']) -
-            (0.05194806 * section['backup_mud'] * section['tvd'])
-        )
+    # Prefer the hydrostatic products cached at section-add time; compute
+    # them on the fly for ad-hoc dicts built by external callers
+    mw = section['mud_weight']
+    bm = section['backup_mud']
+    tvd = section['tvd']
+    hydro_mw = section.get('hydro_mw')
+    if hydro_mw is None:
+        hydro_mw = _PPG_TO_PSI_FT * mw * tvd
+    hydro_bm = section.get('hydro_bm')
+    if hydro_bm is None:
+        hydro_bm = _PPG_TO_PSI_FT * bm * tvd
+
+    # Unpack the dict once and run the arithmetic in the compiled kernel
+    maps, burst_load, burst_df = _solo_maps_burst(
+        mw,
+        bm,
+        tvd,
+        section['frac_init_pressure'],
+        section['burst_strength'],
+        hydro_mw,
+        hydro_bm
     )
 
-    # Calculate burst design factor, handling zero burst load case
-    burst_df = float(section['burst_strength']) / float(burst_load) if float(burst_load) > 0 else float('inf')
-
     # Update section dictionary with calculated values
     section.update({'maps': maps, 'burst_load': burst_load, 'burst_df': burst_df})
     return section
@@ -116,13 +622,19 @@ def calculate_maps(sec1: Dict[str, float], sec2: Dict[str, float]) -> float:
         >>> print(f"MAPS: {maps:.0f} psi")
         MAPS: 7292 psi
     """
-    # Calculate bottomhole pressure at lower section
-    next_bhp = sec2['mud_weight'] * sec2['tvd'] * 0.05194806
-
-    # Calculate MAPS considering depth differential and internal gradient
-    maps = next_bhp - (sec2['tvd'] - sec1['tvd']) * sec2['int_gradient']
-
-    return maps
+    # The lower section's bottomhole pressure is its cached hydrostatic
+    # mud product when available
+    next_bhp = sec2.get('hydro_mw')
+    if next_bhp is None:
+        next_bhp = _PPG_TO_PSI_FT * sec2['mud_weight'] * sec2['tvd']
+
+    # Unpack the dicts once and run the arithmetic in the compiled kernel
+    return _calc_maps(
+        next_bhp,
+        sec2['tvd'],
+        sec1['tvd'],
+        sec2['int_gradient']
+    )
 
 def calculate_burst_load(sec1: Dict[str, float], sec2: Dict[str, float], maps: float) -> float:
     """Calculates maximum burst load between casing sections considering differential
@@ -173,21 +685,114 @@ def calculate_burst_load(sec1: Dict[str, float], sec2: Dict[str, float], maps: f
         >>> print(f"Burst Load: {burst_load:.0f} psi")
         Burst Load: 3325 psi
     """
-    # Calculate differential pressure from mud weights
-    part1 = 0.05194806 * (sec1['mud_weight'] - sec1['backup_mud']) * sec1['tvd']
-
-    # Calculate minimum pressure considering fracture initiation
-    minPart1 = sec1['frac_init_pressure'] - (sec1['tvd'] - sec1['tvd']) * sec2['int_gradient'] - \
-               (0.05194806 * sec1['backup_mud'] * sec1['tvd'])
-
-    # Calculate minimum pressure considering MAPS
-    minPart2 = maps - sec1['int_gradient'] * (sec1['tvd'] - sec1['tvd']) - \
-               (0.05194806 * sec1['backup_mud'] * sec1['tvd'])
+    # Prefer the hydrostatic product cached at section-add time
+    hydro_bm = sec1.get('hydro_bm')
+    if hydro_bm is None:
+        hydro_bm = _PPG_TO_PSI_FT * sec1['backup_mud'] * sec1['tvd']
+
+    # Unpack the dicts once and run the arithmetic in the compiled kernel;
+    # sec2 is kept in the signature for call-site compatibility (its only
+    # contribution multiplied an identically-zero depth differential)
+    return _calc_burst_load(
+        sec1['mud_weight'],
+        sec1['backup_mud'],
+        sec1['tvd'],
+        sec1['frac_init_pressure'],
+        maps,
+        hydro_bm
+    )
 
-    # Determine maximum burst load from all scenarios
-    max_all = max(part1, min(minPart1, minPart2))
+@dataclass(slots=True)
+class Section:
+    """Fixed-layout record for a single wellbore casing section.
+
+    Replaces the former per-section dict: every known input property and
+    every computed result is a slot, so field access is a fixed-offset read
+    instead of a hash lookup and per-section memory drops substantially.
+
+    Dict-style access (section['tvd'], section.get('md_top', ...),
+    section.update({...})) is preserved so existing key-based consumers and
+    ad-hoc callers keep working unchanged. Unknown keys raise KeyError just
+    as they would on a dict with missing entries.
+
+    Attributes are grouped as:
+        - Geometry/placement: top, bottom, id, tvd, od, length, md_top,
+          md_bottom
+        - Casing specification: casing_type, weight, grade, connection,
+          hole_size, washout, wall_thickness, csg_internal_diameter
+        - Fluids/cement: int_gradient, mud_weight, backup_mud, cement_cu_ft,
+          frac_gradient
+        - Ratings: body_yield, burst_strength, collapse_pressure,
+          tension_strength
+        - Computed results (populated by calcParametersContained):
+          cement_height, toc, masp, collapse_strength, collapse_load,
+          collapse_df, neutral_point, tension_df, tension_air,
+          tension_buoyed, frac_init_pressure, maps, burst_load, burst_df
+    """
+    top: Optional[float] = None
+    bottom: Optional[float] = None
+    id: Any = None
+    tvd: Optional[float] = None
+    od: Optional[float] = None
+    length: Optional[float] = None
+    md_top: Optional[float] = None
+    md_bottom: Optional[float] = None
+    casing_type: Optional[str] = None
+    weight: Optional[float] = None
+    grade: Optional[str] = None
+    connection: Optional[str] = None
+    hole_size: Optional[float] = None
+    washout: Optional[float] = None
+    wall_thickness: Optional[float] = None
+    csg_internal_diameter: Optional[float] = None
+    int_gradient: Optional[float] = None
+    mud_weight: Optional[float] = None
+    backup_mud: Optional[float] = None
+    cement_cu_ft: Optional[float] = None
+    frac_gradient: Optional[float] = None
+    body_yield: Optional[float] = None
+    burst_strength: Optional[float] = None
+    collapse_pressure: Optional[float] = None
+    tension_strength: Optional[float] = None
+    cement_height: Optional[float] = None
+    toc: Optional[float] = None
+    masp: Optional[float] = None
+    collapse_strength: Optional[float] = None
+    collapse_load: Optional[float] = None
+    collapse_df: Optional[float] = None
+    neutral_point: Optional[float] = None
+    tension_df: Optional[float] = None
+    tension_air: Optional[float] = None
+    tension_buoyed: Optional[float] = None
+    frac_init_pressure: Optional[float] = None
+    maps: Optional[float] = None
+    burst_load: Optional[float] = None
+    burst_df: Optional[float] = None
+    hydro_mw: Optional[float] = None
+    hydro_bm: Optional[float] = None
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the field value, or default when unset/unknown."""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def update(self, data: Dict[str, Any]) -> None:
+        """Merges a mapping of field values, mirroring dict.update."""
+        for key, value in data.items():
+            self[key] = value
 
-    return max_all
 
 class WellBoreExpanded(String):
     """A specialized wellbore class that extends the String class with additional depth parameters.
@@ -227,6 +832,17 @@ class WellBoreExpanded(String):
         ... )
     """
 
+    # Parameters every section must provide; a class-level frozenset so the
+    # validation set is built once, not per add_section call
+    REQUIRED_PARAMS: frozenset = frozenset({
+        'id', 'tvd', 'od', 'bottom', 'casing_type', 'weight', 'grade',
+        'connection', 'hole_size', 'washout',
+        'int_gradient', 'mud_weight', 'backup_mud', 'cement_cu_ft',
+        'body_yield', 'burst_strength',
+        'wall_thickness', 'csg_internal_diameter', 'collapse_pressure',
+        'tension_strength'
+    })
+
     def __init__(
             self,
             name: str,
@@ -265,30 +881,32 @@ class WellBoreExpanded(String):
 
         Raises:
             ValueError: If any of the following conditions are met:
-                - max_md_depth is not a number or is not positive
-                - max_tvd_depth is not a number or is not positive
-                - tol is not a number or is negative
+                - max_md_depth is not a finite, positive number
+                - max_tvd_depth is not a finite, positive number
+                - tol is not a finite, non-negative number
 
         Notes:
             - max_md_depth must be greater than 0 as a wellbore cannot have zero or negative depth
             - max_tvd_depth must be greater than 0 for valid vertical depth measurements
             - tol (top of liner) must be non-negative as it represents a physical depth
+            - __init__ already coerces the values via float(), so type checks
+              are unnecessary; isfinite additionally rejects NaN and infinity
 
         Example:
             >>> wellbore = WellBoreExpanded(name="WELL-A", top=0, bottom=1000,
             ...                            max_md_depth=-100, max_tvd_depth=900, tol=0)
             ValueError: max_md_depth must be a positive number.
         """
-        # Validate measured depth is a positive number
-        if not isinstance(self.max_md_depth, (int, float)) or self.max_md_depth <= 0:
+        # Validate measured depth is a finite, positive number
+        if not (isfinite(self.max_md_depth) and self.max_md_depth > 0):
             raise ValueError("max_md_depth must be a positive number.")
 
-        # Validate true vertical depth is a positive number
-        if not isinstance(self.max_tvd_depth, (int, float)) or self.max_tvd_depth <= 0:
+        # Validate true vertical depth is a finite, positive number
+        if not (isfinite(self.max_tvd_depth) and self.max_tvd_depth > 0):
             raise ValueError("max_tvd_depth must be a positive number.")
 
-        # Validate top of liner is non-negative
-        if not isinstance(self.tol, (int, float)) or self.tol < 0:
+        # Validate top of liner is finite and non-negative
+        if not (isfinite(self.tol) and self.tol >= 0):
             raise ValueError("tol (top of liner) must be a non-negative number.")
 
     def add_section_with_properties(self, **kwargs) -> NoReturn:
@@ -339,19 +957,18 @@ class WellBoreExpanded(String):
             ...     # ... other required parameters ...
             ... )
         """
-        # Define required parameters for section creation
-        required_params: list[str] = [
-            'id', 'tvd', 'od', 'bottom', 'casing_type', 'weight', 'grade',
-            'connection', 'hole_size', 'washout',
-            'int_gradient', 'mud_weight', 'backup_mud', 'cement_cu_ft',
-            'body_yield', 'burst_strength',
-            'wall_thickness', 'csg_internal_diameter', 'collapse_pressure', 'tension_strength'
-        ]
-
-        # Validate presence of all required parameters
-        missing_params: list[str] = [param for param in required_params if param not in kwargs]
+        # Validate presence of all required parameters via C-level set
+        # difference against the kwargs key view; sort only on the error path
+        missing_params = self.REQUIRED_PARAMS - kwargs.keys()
         if missing_params:
-            raise ValueError(f"Missing required parameters for section: {missing_params}")
+            raise ValueError(
+                f"Missing required parameters for section: {sorted(missing_params)}"
+            )
+
+        # Cache the hydrostatic mud products; they are invariant once the
+        # section is defined and every downstream burst calculation uses them
+        kwargs['hydro_mw'] = _PPG_TO_PSI_FT * kwargs['mud_weight'] * kwargs['tvd']
+        kwargs['hydro_bm'] = _PPG_TO_PSI_FT * kwargs['backup_mud'] * kwargs['tvd']
 
         # Add section based on specified method
         if self.method == "top_down":
@@ -360,6 +977,52 @@ class WellBoreExpanded(String):
             self.add_section_bottom_up_new(**kwargs)
 
 
+    def add_sections_bulk(self, **columns) -> None:
+        """Adds every wellbore section from parallel per-property arrays.
+
+        Structure-of-arrays counterpart to calling
+        add_section_with_properties once per section: each keyword is a
+        column (NumPy array, Series or list) holding that property for all
+        sections in order. Validation runs once over the column names, the
+        hydrostatic mud products are computed vectorized, and the per-row
+        work reduces to building the Section records and chaining their top
+        depths, so the N*20-kwarg Python call overhead of the per-section
+        path disappears.
+
+        Args:
+            **columns: One array-like per required section property (see
+                REQUIRED_PARAMS), all of equal length, ordered top-down or
+                bottom-up to match self.method.
+
+        Raises:
+            ValueError: If any required property column is missing.
+
+        Example:
+            >>> wellbore.add_sections_bulk(
+            ...     id=np.arange(3), casing_type=labels, od=od_arr,
+            ...     bottom=bottom_arr, ...)
+        """
+        missing_params = self.REQUIRED_PARAMS - columns.keys()
+        if missing_params:
+            raise ValueError(
+                f"Missing required parameters for section: {sorted(missing_params)}"
+            )
+
+        # Vectorize the invariant hydrostatic mud products across all rows
+        mud_weight = np.asarray(columns['mud_weight'], dtype=np.float64)
+        backup_mud = np.asarray(columns['backup_mud'], dtype=np.float64)
+        tvd = np.asarray(columns['tvd'], dtype=np.float64)
+        columns['hydro_mw'] = _PPG_TO_PSI_FT * mud_weight * tvd
+        columns['hydro_bm'] = _PPG_TO_PSI_FT * backup_mud * tvd
+
+        names = list(columns)
+        if self.method == "top_down":
+            for row in zip(*columns.values()):
+                self.add_section_top_down_new(**dict(zip(names, row)))
+        elif self.method == "bottom_up":
+            for row in zip(*columns.values()):
+                self.add_section_bottom_up_new(**dict(zip(names, row)))
+
     def add_section_top_down_new(self, **kwargs: Dict[str, Any]) -> NoReturn:
         """Adds a new wellbore section using a top-down approach.
 
@@ -374,8 +1037,8 @@ class WellBoreExpanded(String):
         Notes:
             - For first section (empty self.sections), starts at wellbore top
             - For subsequent sections, starts at previous section's bottom
-            - Automatically sorts sections based on top depth
-            - Re-indexes sections to maintain sequential numbering
+            - Sections arrive in strict top-down order, so each new section
+              is appended at the next index with no re-sorting
             - Updates completion status when bottom depth matches target
 
         Example:
@@ -394,34 +1057,24 @@ class WellBoreExpanded(String):
             temp = len(self.sections)  # Next available index
             top = self.sections[temp - 1]['bottom']  # Use previous section bottom
 
-        # Create new section entry and set its top depth
-        self.sections[temp] = {}
-        self.sections[temp]['top'] = top
+        # Create new section record and set its top depth
+        section = Section(top=top)
 
         # Add all provided section properties
         for k, v in kwargs.items():
-            self.sections[temp][k] = v
-
-        # Sort sections by top depth to maintain proper order
-        self.sections = {
-            k: v
-            for k, v in sorted(
-                self.sections.items(), key=lambda item: item[1]['top']
-            )
-        }
+            section[k] = v
+        self.sections[temp] = section
 
-        # Re-index sections to ensure sequential numbering
-        temp = {}
-        for i, (k, v) in enumerate(self.sections.items()):
-            temp[i] = v
+        # Sections are added in strict top-down order, so the new section is
+        # already the deepest and the dict stays sorted without a rebuild
 
-        # Check if wellbore is complete (bottom depth matches target)
-        if temp[len(temp) - 1]['bottom'] == self.bottom:
+        # Check if wellbore is complete (bottom depth matches target);
+        # depths have been through float() casts and arithmetic, so compare
+        # with tolerance rather than exact FP equality
+        if isclose(self.sections[temp]['bottom'], self.bottom,
+                   rel_tol=1e-9, abs_tol=1e-6):
             self.complete = True
 
-        # Update sections with re-indexed dictionary
-        self.sections = temp
-
     def add_section_bottom_up_new(self, **kwargs: Dict[str, Any]) -> NoReturn:
         """Adds a new wellbore section using a bottom-up approach with measured depth support.
 
@@ -444,8 +1097,9 @@ class WellBoreExpanded(String):
                 1. Length calculation (bottom - length)
                 2. Explicit top value if provided
                 3. Wellbore top as default
-            - Automatically sorts sections based on md_bottom or bottom depth
-            - Maintains reverse order sorting for bottom-up configuration
+            - Sections arrive in strict bottom-up order, so appending at the
+              next index reproduces the reverse-depth ordering without a
+              re-sort
             - Updates completion status when topmost section reaches wellbore top
 
         Example:
@@ -473,34 +1127,93 @@ class WellBoreExpanded(String):
         else:
             top = self.top  # Default to wellbore top
 
-        # Create new section entry with top and bottom depths
-        self.sections[temp] = {'top': top, 'bottom': bottom}
+        # Create new section record with top and bottom depths
+        section = Section(top=top, bottom=bottom)
 
         # Add all provided section properties
         for k, v in kwargs.items():
-            self.sections[temp][k] = v
-
-        # Sort sections by measured depth or regular depth in reverse order
-        self.sections = {
-            k: v
-            for k, v in sorted(
-                self.sections.items(),
-                key=lambda item: item[1].get('md_bottom', item[1]['bottom']),
-                reverse=True  # Maintain bottom-up order
-            )
-        }
+            section[k] = v
+        self.sections[temp] = section
+
+        # Sections are added in strict bottom-up order, so appending at the
+        # next index matches the reverse-depth ordering previously produced
+        # by the sort and no rebuild is needed
+
+        # Update completion status if top section reaches wellbore top;
+        # tops may come from bottom - length arithmetic, so compare with
+        # tolerance rather than exact FP equality
+        if isclose(self.sections[0]['top'], self.top,
+                   rel_tol=1e-9, abs_tol=1e-6):
+            self.complete = True
 
-        # Re-index sections to ensure sequential numbering
-        temp = {}
-        for i, (k, v) in enumerate(self.sections.items()):
-            temp[i] = v
+    def sections_dataframe(self) -> pd.DataFrame:
+        """Materializes all sections as a single columnar DataFrame.
 
-        # Update completion status if top section reaches wellbore top
-        if temp[0]['top'] == self.top:
-            self.complete = True
+        Builds a record table whose rows are the wellbore sections (in their
+        current storage order) and whose columns are the named section
+        properties, giving downstream code a contiguous Structure-of-Arrays
+        view for vectorized bulk calculations.
 
-        # Update sections with re-indexed dictionary
-        self.sections = temp
+        Returns:
+            pd.DataFrame: One row per section, indexed by the current section
+                keys (numeric indices during construction, casing types after
+                create_variables has run). Columns cover every property
+                present on the sections, including any results merged in by
+                calcParametersContained.
+
+        Notes:
+            - The dict-of-dicts in self.sections remains the primary store;
+              the parent String class and key-based consumers depend on it
+            - The DataFrame is a fresh materialization, not a live view;
+              re-call after mutating sections
+
+        Example:
+            >>> wellbore.calcParametersContained()
+            >>> df = wellbore.sections_dataframe()
+            >>> df.loc['surface', 'burst_df']
+            1.408
+        """
+        return pd.DataFrame(
+            list(self.sections.values()),
+            index=list(self.sections.keys())
+        )
+
+    def _sections_to_arrays(self) -> Dict[str, np.ndarray]:
+        """Packs per-section burst-design inputs into contiguous NumPy arrays.
+
+        Converts the dict-per-section storage into a Structure-of-Arrays layout
+        so that inter-section pressure calculations can run as vectorized NumPy
+        operations instead of per-section Python calls.
+
+        Returns:
+            Dict[str, np.ndarray]: Mapping of field name to a 1-D float64 array
+                ordered by section index, with keys:
+                mud_weight, backup_mud, tvd, frac_init_pressure,
+                int_gradient, burst_strength
+
+        Notes:
+            - Sections must already hold frac_init_pressure, i.e. CasingDataCalc
+              results must have been merged in before calling
+            - Array order matches the numeric section indexing (top to bottom)
+
+        Example:
+            >>> arrays = wellbore._sections_to_arrays()
+            >>> arrays['tvd']
+            array([ 2500.,  9300., 10250.])
+        """
+        fields = (
+            'mud_weight', 'backup_mud', 'tvd',
+            'frac_init_pressure', 'int_gradient', 'burst_strength'
+        )
+        n = len(self.sections)
+        return {
+            field: np.fromiter(
+                (self.sections[i][field] for i in range(n)),
+                dtype=np.float64,
+                count=n
+            )
+            for field in fields
+        }
 
     def calcParametersContained(self) -> NoReturn:
         """Processes and calculates mechanical properties for all wellbore sections.
@@ -552,62 +1265,92 @@ class WellBoreExpanded(String):
             >>> print(wellbore.sections['surface']['burst_df'])
             1.25
         """
-        # Initialize parameters and tracking variables
-        secs_num: int = 0
-        univ_params: Dict[str, float] = {
-            'max_md_depth': self.max_md_depth,
-            'max_tvd_depth': self.max_tvd_depth,
-            'tol': self.tol,
-            'frac_gradient': self.frac_gradient
-        }
+        # Initialize parameters and tracking variables; hoist the section
+        # count so it is computed exactly once
+        secs_num: int = len(self.sections)
+        univ_params = UnivParams(
+            max_md_depth=self.max_md_depth,
+            max_tvd_depth=self.max_tvd_depth,
+            tol=self.tol,
+            frac_gradient=self.frac_gradient
+        )
         variables: List[str] = []  # Track casing types for variable creation
 
-        # Process individual section calculations
-        for i in range(len(self.sections)):
-            calc_output = CasingDataCalc(self.sections[i], univ_params)
-            calc_data = calc_output.get_results()
-            self.sections[i].update(calc_data)
-            variables.append(self.sections[i]['casing_type'])
-            secs_num += 1
+        # Fast path: single-section wellbores (common for surface-only quick
+        # checks) skip the SoA build, the multi-section branch and the
+        # variables bookkeeping entirely
+        if secs_num == 1:
+            section = self.sections[0]
+            section.update(
+                CasingDataCalc(section, univ_params).get_results()._asdict()
+            )
+            calculateSoloMapsBurstLoadDF(section)
+            self.create_variables([section['casing_type']])
+            return
+
+        # Run the whole per-section battery as one columnar pass over the
+        # sections frame instead of instantiating CasingDataCalc per
+        # section, then scatter the result rows back onto the sections
+        battery = compute_all(self.sections_dataframe(), univ_params)
+        for idx, record in zip(battery.index, battery.to_dict('records')):
+            self.sections[idx].update(record)
+            variables.append(self.sections[idx]['casing_type'])
 
         # Handle multi-section calculations
         if secs_num > 1:
-            # Process inter-section properties except for last section
-            for i in range(len(self.sections) - 1):
-                maps: float = calculate_maps(self.sections[i], self.sections[i + 1])
-                burst_load: float = calculate_burst_load(
-                    self.sections[i],
-                    self.sections[i + 1],
-                    maps
-                )
+            # Stack section properties into contiguous SoA arrays
+            arrays = self._sections_to_arrays()
+            mw, bm, tvd = arrays['mud_weight'], arrays['backup_mud'], arrays['tvd']
+            fip, ig, bs = (
+                arrays['frac_init_pressure'],
+                arrays['int_gradient'],
+                arrays['burst_strength']
+            )
 
-                # Calculate burst design factor with infinity handling for zero loads
-                burst_df: float = (
-                    float(self.sections[i]['burst_strength']) / float(burst_load)
-                    if float(burst_load) > 0
-                    else float('inf')
+            if njit is not None and secs_num >= _PARALLEL_SECTION_THRESHOLD:
+                # Many-section wellbore: amortize the thread-team startup
+                # cost across sections with the prange batch kernel
+                maps_arr = np.empty(secs_num - 1)
+                burst_load_arr = np.empty(secs_num - 1)
+                burst_df_arr = np.empty(secs_num - 1)
+                _pair_maps_burst_batch(
+                    mw, bm, tvd, fip, ig, bs,
+                    maps_arr, burst_load_arr, burst_df_arr
+                )
+            else:
+                # MAPS for every adjacent section pair in one vectorized pass
+                next_bhp = mw[1:] * tvd[1:] * _PPG_TO_PSI_FT
+                maps_arr = next_bhp - (tvd[1:] - tvd[:-1]) * ig[1:]
+
+                # Burst load scenarios (mud differential vs frac/MAPS limits)
+                part1 = _PPG_TO_PSI_FT * (mw[:-1] - bm[:-1]) * tvd[:-1]
+                min_part1 = fip[:-1] - _PPG_TO_PSI_FT * bm[:-1] * tvd[:-1]
+                min_part2 = maps_arr - _PPG_TO_PSI_FT * bm[:-1] * tvd[:-1]
+                burst_load_arr = np.maximum(
+                    part1, np.minimum(min_part1, min_part2)
                 )
 
-                # Update section with calculated properties
+                # Burst design factor with infinity handling for zero loads;
+                # the inner where substitutes a dummy divisor so the single
+                # SIMD divide pass never raises divide-by-zero warnings
+                positive = burst_load_arr > 0
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    burst_df_arr = np.where(
+                        positive,
+                        bs[:-1] / np.where(positive, burst_load_arr, 1.0),
+                        np.inf
+                    )
+
+            # Scatter vectorized results back into the section dictionaries
+            for i in range(secs_num - 1):
                 self.sections[i].update({
-                    'maps': maps,
-                    'burst_load': burst_load,
-                    'burst_df': burst_df
+                    'maps': float(maps_arr[i]),
+                    'burst_load': float(burst_load_arr[i]),
+                    'burst_df': float(burst_df_arr[i])
                 })
-                counter = i + 1
-
-            # Process final section with solo calculations
-            solo_data: Dict[str, float] = calculateSoloMapsBurstLoadDF(
-                self.sections[counter]
-            )
-            self.sections[counter].update(solo_data)
 
-        else:
-            # Handle single section calculations
-            solo_data: Dict[str, float] = calculateSoloMapsBurstLoadDF(
-                self.sections[0]
-            )
-            self.sections[0].update(solo_data)
+            # Process final section with solo calculations (updated in place)
+            calculateSoloMapsBurstLoadDF(self.sections[secs_num - 1])
 
         # Create reference variables for all casing types
         self.create_variables(variables)
@@ -647,6 +1390,27 @@ class WellBoreExpanded(String):
             self.sections[variables[i]] = self.sections.pop(i)
 
 
+@lru_cache(maxsize=4096)
+def _cement_height(hole_size: float, csg_size: float, washout: float,
+                   cement_cu_ft: float) -> float:
+    """Pure, memoized cement-column height for a hole/casing/washout combo.
+
+    Design-iteration sweeps evaluate the same (hole_size, csg_size, washout,
+    cement_cu_ft) combination repeatedly across candidate strings; the small
+    hashable key makes an lru_cache hit far cheaper than redoing the annular
+    capacity arithmetic. The cheaper annular-volume expression is deliberately
+    not memoized - it costs less than a cache lookup.
+    """
+    if csg_size > 0:
+        effective_hole_size = hole_size * (1 + washout / 100)
+        annular_volume_per_foot = (
+            (effective_hole_size * effective_hole_size - csg_size * csg_size)
+            / _ANNULAR_CAPACITY_FACTOR
+        )
+        return (1 / annular_volume_per_foot) * cement_cu_ft
+    return 0
+
+
 class CasingDataCalc:
     """Calculates and stores mechanical and geometric properties for wellbore casing sections.
 
@@ -705,73 +1469,91 @@ class CasingDataCalc:
                 collapse_pressure: float - Collapse pressure rating
                 tension_strength: float - Tension strength
 
-        univ_params: Dict[str, float]
-            Universal parameters including:
+        univ_params: Union[UnivParams, Dict[str, float]]
+            Universal parameters (namedtuple preferred, dict accepted)
+            including:
                 tol: float - Calculation tolerance
                 max_md_depth: float - Maximum measured depth
                 max_tvd_depth: float - Maximum true vertical depth
+                frac_gradient: float - Formation fracture gradient
 
     Methods:
         calculateData(): NoReturn
             Performs all casing calculations and stores results
 
     Notes:
-        - All calculations are performed during initialization
+        - Calculations run lazily on first access to any result field
         - Results are stored in self.results dictionary
-        - None values indicate uncalculated properties
         - All dimensions should be in consistent units
     """
 
+    # Fixed attribute layout: a C-level slot array instead of a per
+    # instance dict, which shrinks each instance and makes attribute
+    # access a direct offset load. Result slots stay unbound until the
+    # lazy calculation fills them.
+    __slots__ = (
+        # casing and mechanical inputs
+        'tvd', 'washout', 'int_gradient', 'mud_weight', 'backup_mud',
+        'cement_cu_ft', 'hole_size', 'set_depth', 'casing_top',
+        'csg_weight', 'csg_weight_kips', 'csg_size', 'csg_grade',
+        'csg_collar', 'body_yield',
+        'burst_strength', 'wall_thickness', 'csg_internal_diameter',
+        'collapse_strength', 'tension_strength',
+        # wellbore universals
+        'max_md_depth', 'max_tvd_depth', 'tol', 'frac_gradient',
+        # lazily computed results
+        'frac_init_pressure', 'annular_volume', 'cmt_height', 'toc',
+        'masp', 'collapse_load', 'collapse_df', 'neutral_point',
+        'tension_air', 'tension_buoyed', 'tension_df', 'results',
+    )
+
+    # Attributes produced by calculateData; reading any of them on a not
+    # yet calculated instance triggers the single fused kernel call
+    _RESULT_FIELDS = frozenset({
+        'frac_init_pressure', 'annular_volume', 'cmt_height', 'toc', 'masp',
+        'collapse_load', 'collapse_df', 'neutral_point', 'tension_air',
+        'tension_buoyed', 'tension_df', 'results',
+    })
+
     def __init__(self, casing: Dict[str, Any], univ_params: Dict[str, float]) -> None:
-        # Initialize calculation results
-        self.tension_df: Optional[float] = None
-        self.tension_buoyed: Optional[float] = None
-        self.tension_air: Optional[float] = None
-        self.neutral_point: Optional[float] = None
-        self.collapse_df: Optional[float] = None
-        self.masp: Optional[float] = None
-        self.collapse_load: Optional[float] = None
-        self.toc: Optional[float] = None
-        self.cmt_height: Optional[float] = None
-        self.annular_volume: Optional[float] = None
-        self.frac_init_pressure: Optional[float] = None
-        self.results: Dict[str, Any] = {}
-
-        # Store casing properties
-        # self.frac_gradient: float = casing['frac_gradient']
-        self.tvd: float = casing['tvd']
-        self.washout: float = casing['washout']
-        self.int_gradient: float = casing['int_gradient']
-        self.mud_weight: float = casing['mud_weight']
-        self.backup_mud: float = casing['backup_mud']
-        self.cement_cu_ft: float = casing['cement_cu_ft']
-        self.hole_size: float = casing['hole_size']
-        self.set_depth: float = casing['bottom']
-        self.casing_top: float = casing['top']
-        self.csg_weight: float = casing['weight']
-        self.csg_size: float = casing['od']
-        self.csg_grade: str = casing['grade']
-
-        # Store mechanical properties
-        self.csg_collar: str = casing['connection']
-        self.body_yield: float = casing['body_yield']
-        self.burst_strength: float = casing['burst_strength']
-        self.wall_thickness: float = casing['wall_thickness']
-        self.csg_internal_diameter: float = casing['csg_internal_diameter']
-        self.collapse_strength: float = casing['collapse_pressure']
-        self.tension_strength: float = casing['tension_strength']
-
-        # Store universal parameters
-        self.tol: float = univ_params['tol']
-        self.frac_gradient: float = univ_params['frac_gradient']
-        self.max_md_depth: float = univ_params['max_md_depth']
-        self.max_tvd_depth: float = univ_params['max_tvd_depth']
-
-        # Perform calculations
-        self.calculateData()
+        # Store casing and mechanical properties through one bulk getter
+        # instead of twenty individual keyed lookups
+        (self.tvd, self.washout, self.int_gradient, self.mud_weight,
+         self.backup_mud, self.cement_cu_ft, self.hole_size, self.set_depth,
+         self.casing_top, self.csg_weight, self.csg_size, self.csg_grade,
+         self.csg_collar, self.body_yield, self.burst_strength,
+         self.wall_thickness, self.csg_internal_diameter,
+         self.collapse_strength, self.tension_strength
+         ) = _CASING_FIELDS_GETTER(casing)
+
+        # Fold the lbs->kips conversion into the weight once at ingest so
+        # the tension expressions multiply instead of dividing per call
+        self.csg_weight_kips: float = self.csg_weight * 1e-3
+
+        # Store universal parameters; accept legacy dicts from external
+        # callers as well as the UnivParams namedtuple
+        if isinstance(univ_params, dict):
+            univ_params = UnivParams(**univ_params)
+        (self.max_md_depth, self.max_tvd_depth, self.tol,
+         self.frac_gradient) = univ_params
+
+    def __getattr__(self, name: str) -> Any:
+        """Lazily computes all results on first access to any result field.
+
+        The eleven derived quantities come out of one fused kernel call, so
+        the first read of any of them (or of ``results``) triggers
+        calculateData once and every later read is a plain attribute hit.
+        Callers that never touch the results pay nothing.
+        """
+        if name in self._RESULT_FIELDS:
+            self.calculateData()
+            return getattr(self, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
 
     def calculateData(self) -> NoReturn:
-        """Performs all casing calculations and stores results in the results dictionary.
+        """Performs all casing calculations and stores results in self.results.
 
         Executes a series of calculations to determine casing mechanical properties,
         pressure ratings, and geometric characteristics. All calculations are performed
@@ -805,51 +1587,47 @@ class CasingDataCalc:
             >>> print(casing_calc.results['masp'])
             3500.0
         """
-        # Calculate formation pressure characteristics
-        self.frac_init_pressure = self.frac_gradient * self.tvd
-
-        # Calculate cement properties
-        self.annular_volume = self.calculate_cement_volume()
-        self.cmt_height = self.calculate_cement_height()
-        self.toc = self.calculate_toc()
-
-        # Calculate pressure ratings
-        self.masp = self.calculate_masp()
-        self.collapse_load = self.calculate_collapse_load()
-        self.collapse_df = self.calculate_collapse_df()
-
-        # Calculate mechanical loading conditions
-        self.neutral_point = self.calculate_neutral_point()
-        self.tension_air = self.calculate_tension_air()
-        self.tension_buoyed = self.calculate_tension_buoyed()
-        self.tension_df = self.calculate_tension_df()
-
-        # Consolidate results in dictionary
-        self.results = {
-            'cement_cu_ft': self.cement_cu_ft,  # Cement volume
-            'cement_height': self.cmt_height,  # Height of cement column
-            'toc': self.toc,  # Top of cement
-            'masp': self.masp,  # Maximum allowable surface pressure
-            'collapse_strength': self.collapse_strength,  # Rated collapse strength
-            'collapse_load': self.collapse_load,  # Applied collapse load
-            'collapse_df': self.collapse_df,  # Collapse design factor
-            'burst_strength': self.burst_strength,  # Rated burst strength
-            'neutral_point': self.neutral_point,  # Neutral point depth
-            'tension_strength': self.tension_strength,  # Rated tension strength
-            'tension_df': self.tension_df,  # Tension design factor
-            'tension_air': self.tension_air,  # Air weight tension
-            'tension_buoyed': self.tension_buoyed,  # Buoyed tension
-            'frac_init_pressure': self.frac_init_pressure  # Initial fracture pressure
-        }
+        # Run the whole battery in the compiled scalar kernel and unpack;
+        # the individual calculate_* methods remain for direct callers.
+        # The AOT build is preferred when present since it skips JIT warmup
+        kernel = _calc_all_aot if _calc_all_aot is not None else _calc_all
+        (self.frac_init_pressure, self.annular_volume, self.cmt_height,
+         self.toc, self.masp, self.collapse_load, self.collapse_df,
+         self.neutral_point, self.tension_air, self.tension_buoyed,
+         self.tension_df) = kernel(
+            self.tvd, self.washout, self.int_gradient, self.mud_weight,
+            self.cement_cu_ft, self.hole_size, self.set_depth,
+            self.csg_weight, self.csg_size, self.csg_internal_diameter,
+            self.collapse_strength, self.tension_strength, self.tol,
+            self.frac_gradient, self.max_md_depth, self.max_tvd_depth
+        )
+
+        # Consolidate results in one immutable struct
+        self.results = CasingResults(
+            cement_cu_ft=self.cement_cu_ft,
+            cement_height=self.cmt_height,
+            toc=self.toc,
+            masp=self.masp,
+            collapse_strength=self.collapse_strength,
+            collapse_load=self.collapse_load,
+            collapse_df=self.collapse_df,
+            burst_strength=self.burst_strength,
+            neutral_point=self.neutral_point,
+            tension_strength=self.tension_strength,
+            tension_df=self.tension_df,
+            tension_air=self.tension_air,
+            tension_buoyed=self.tension_buoyed,
+            frac_init_pressure=self.frac_init_pressure
+        )
 
-    def get_results(self) -> Dict[str, Any]:
+    def get_results(self) -> CasingResults:
         """Returns the complete set of casing calculation results.
 
         Provides access to all calculated parameters including mechanical properties,
         pressure ratings, and geometric characteristics of the casing design.
 
         Returns:
-            Dict[str, Any]: A dictionary containing all calculated results including:
+            CasingResults: A named tuple containing all calculated results including:
                 cement_cu_ft (float): Volume of cement in cubic feet
                 cement_height (float): Total height of cement column
                 toc (float): Top of cement depth
@@ -867,7 +1645,7 @@ class CasingDataCalc:
 
         Example:
             >>> results = casing_calc.get_results()
-            >>> print(f"MASP: {results['masp']} psi")
+            >>> print(f"MASP: {results.masp} psi")
             MASP: 3500.0 psi
         """
         return self.results
@@ -896,14 +1674,13 @@ class CasingDataCalc:
             >>> print(f"Annular volume: {volume:.3f} ft³/ft")
             Annular volume: 0.384 ft³/ft
         """
-        # Calculate open hole area in square feet
-        hole_area = math.pi * (self.hole_size / 12) ** 2 / 4
-
-        # Calculate casing outer diameter area in square feet
-        casing_area = math.pi * (self.csg_size / 12) ** 2 / 4
-
-        # Return annular volume in cubic feet per foot
-        return hole_area - casing_area
+        # Single multiply/subtract form of pi/144 * (hole^2 - od^2) / 4;
+        # x*x is a plain MULSD where ** 2 dispatches through pow()
+        return (
+            _PI_OVER_4 * _INCH2_TO_FT2
+            * (self.hole_size * self.hole_size
+               - self.csg_size * self.csg_size)
+        )
 
     def calculate_cement_height(self) -> float:
         """Calculates the vertical height of cement column in the annular space.
@@ -937,17 +1714,11 @@ class CasingDataCalc:
             >>> print(f"Cement height: {height:.1f} ft")
             Cement height: 1250.5 ft
         """
-        if self.csg_size > 0:
-            # Calculate effective hole size accounting for washout
-            effective_hole_size = self.hole_size * (1 + self.washout / 100)
-
-            # Calculate annular volume per foot using industry standard conversion
-            annular_volume_per_foot = (effective_hole_size ** 2 - self.csg_size ** 2) / 183.35
-
-            # Calculate total height needed for given cement volume
-            return (1 / annular_volume_per_foot) * self.cement_cu_ft
-        else:
-            return 0
+        # Thin forwarder to the memoized module-level function so repeat
+        # hole/casing/washout combinations across sections hit the cache
+        return _cement_height(
+            self.hole_size, self.csg_size, self.washout, self.cement_cu_ft
+        )
 
     def calculate_toc(self) -> float:
         """Calculates the Top of Cement (TOC) depth in the wellbore.
@@ -974,8 +1745,13 @@ class CasingDataCalc:
             >>> print(f"Top of cement: {toc:.1f} ft")
             Top of cement: 3000.0 ft
         """
-        # Calculate cement column height
-        cement_height = self.calculate_cement_height()
+        # Reuse the cement height cached by calculateData (which always
+        # populates it before TOC); only recompute for out-of-order callers
+        cement_height = (
+            self.cmt_height
+            if self.cmt_height is not None
+            else self.calculate_cement_height()
+        )
 
         # Calculate TOC by subtracting cement height from set depth
         output = self.set_depth - cement_height
@@ -1018,20 +1794,14 @@ class CasingDataCalc:
             >>> print(f"MASP: {masp:.0f} psi")
             MASP: 3650 psi
         """
-        # Default pore pressure gradient - consider making this configurable
-        pore_pressure_gradient = 0.465  # psi/ft
-
-        # Calculate pressure components
-        mud_hydrostatic_pressure = 0.05194806 * self.tvd * self.mud_weight
-        internal_pressure = self.int_gradient * self.tvd
-        pore_pressure = pore_pressure_gradient * self.tvd
-
-        # Calculate differential pressures
-        masp_from_pore = pore_pressure - internal_pressure
-        masp_from_mud = mud_hydrostatic_pressure - internal_pressure
-
-        # Return maximum non-negative pressure
-        return max(masp_from_pore, masp_from_mud, 0)
+        # All three differential terms share the tvd factor, so compare
+        # the per-foot gradients first and multiply by depth once
+        # Nested two-arg max avoids the variadic compare chain and lowers
+        # to back-to-back maxsd instructions under numba
+        return self.tvd * max(0.0, max(
+            _PORE_PRESSURE_GRADIENT - self.int_gradient,
+            _PPG_TO_PSI_FT * self.mud_weight - self.int_gradient
+        ))
 
     def calculate_collapse_load(self) -> float:
         """Calculates the differential collapse pressure load at casing bottom.
@@ -1062,7 +1832,7 @@ class CasingDataCalc:
             Collapse load: 7800 psi
         """
         # Calculate external pressure from mud column
-        external_pressure = self.set_depth * self.mud_weight * 0.052
+        external_pressure = self.set_depth * self.mud_weight * _MUD_CONV_PSI_FT
 
         # Assume empty casing for worst-case scenario
         internal_pressure = 0
@@ -1174,7 +1944,7 @@ class CasingDataCalc:
             Neutral point: 8547 ft
         """
         # Calculate neutral point using buoyancy effects
-        return self.tvd * (1 - self.mud_weight / 65.4)
+        return self.tvd * (1 - self.mud_weight / _FRESH_WATER_EQ_PPG)
 
     def calculate_tension_air(self) -> float:
         """Calculates the total tensile load on the casing string in air conditions.
@@ -1207,16 +1977,21 @@ class CasingDataCalc:
             >>> print(f"Air tension: {tension:.1f} kips")
             Air tension: 400.0 kips
         """
-        # Calculate total weight based on setting depth scenario
-        if self.set_depth == self.max_md_depth:
-            # Adjust for tolerance at maximum depth
-            total_weight = self.csg_weight * abs(self.set_depth - self.tol)
-        else:
-            # Standard calculation for normal setting depths
-            total_weight = self.csg_weight * self.set_depth
+        # Weight is pre-folded to kips/ft at ingest
+        eff_depth, _ = self._effective_depths()
+        return self.csg_weight_kips * eff_depth
 
-        # Convert from pounds to kips (1000 lbs)
-        return total_weight / 1000
+    def _effective_depths(self) -> Tuple[float, float]:
+        """Returns (effective depth, effective tvd) with the tol adjustment.
+
+        Both tension calculations branch on whether the casing is set at the
+        maximum measured depth; evaluating the comparison here once gives the
+        pair of adjusted depths they share.
+        """
+        if self.set_depth == self.max_md_depth:
+            return (abs(self.set_depth - self.tol),
+                    abs(self.tvd - self.max_tvd_depth))
+        return self.set_depth, self.tvd
 
     def calculate_tension_buoyed(self) -> float:
         """Calculates the effective tension on the casing string considering buoyancy effects.
@@ -1250,23 +2025,19 @@ class CasingDataCalc:
             >>> print(f"Buoyed tension: {tension:.1f} kips")
             Buoyed tension: 285.3 kips
         """
-        # Calculate cross-sectional area of steel
-        result1 = math.pi / 4 * (self.csg_size ** 2 - self.csg_internal_diameter ** 2)
+        # Calculate cross-sectional area of steel; explicit multiplies
+        # avoid two pow() dispatches per call
+        od2 = self.csg_size * self.csg_size
+        id2 = self.csg_internal_diameter * self.csg_internal_diameter
+        result1 = _PI_OVER_4 * (od2 - id2)
 
-        # Handle maximum depth scenario with tolerance adjustment
-        if self.set_depth == self.max_md_depth:
-            # Calculate buoyancy effect at maximum depth
-            result2 = 0.05194806 * self.mud_weight * abs(self.tvd - self.max_tvd_depth)
-            # Calculate weight with tolerance adjustment
-            result3 = self.csg_weight * abs(self.set_depth - self.tol)
-        else:
-            # Standard calculations for normal depths
-            result2 = 0.05194806 * self.mud_weight * self.tvd
-            result3 = self.csg_weight * self.set_depth
+        # Apply the shared tol adjustment once for both depth terms
+        eff_depth, eff_tvd = self._effective_depths()
+        result2 = _PPG_TO_PSI_FT * self.mud_weight * eff_tvd
+        result3 = self.csg_weight * eff_depth
 
         # Calculate final buoyed tension and convert to kips
-        output = (result3 - result2 * result1) / 1000
-        return output
+        return (result3 - result2 * result1) * 1e-3
 
 
     def calculate_tension_df(self) -> float:
@@ -1305,12 +2076,250 @@ class CasingDataCalc:
             >>> print(f"Tension DF: {df:.2f}")
             Tension DF: 2.00
         """
-        # Avoid division by zero and return infinity if no buoyed tension
-        if self.tension_buoyed == 0:
-            return float('inf')
+        # Calculate design factor as ratio of strength to load; the single
+        # conditional expression lowers to a branchless select under numba
+        return self.tension_strength / self.tension_buoyed if self.tension_buoyed != 0 else float('inf')
 
-        # Calculate design factor as ratio of strength to load
-        return self.tension_strength / self.tension_buoyed
+
+def compute_all(casings: pd.DataFrame,
+                univ_params: Union['UnivParams', Dict[str, float]]) -> pd.DataFrame:
+    """Runs the full CasingDataCalc battery for many casings in one pass.
+
+    Vectorized counterpart to instantiating CasingDataCalc per section:
+    consumes the input columns as contiguous NumPy arrays and produces every
+    result column with array operations, so per-casing Python dispatch
+    disappears entirely. The column contract matches the section field names,
+    so wellbore.sections_dataframe() can be fed in directly.
+
+    Args:
+        casings: DataFrame with one row per casing and columns:
+            tvd, washout, int_gradient, mud_weight, cement_cu_ft, hole_size,
+            bottom, weight, od, csg_internal_diameter, collapse_pressure,
+            tension_strength, burst_strength
+        univ_params: Wellbore-level parameters (UnivParams namedtuple or
+            dict) providing max_md_depth, max_tvd_depth, tol, frac_gradient.
+
+    Returns:
+        pd.DataFrame: One row per casing (same index as the input) with the
+            same columns CasingDataCalc.get_results() reports:
+            cement_cu_ft, cement_height, toc, masp, collapse_strength,
+            collapse_load, collapse_df, burst_strength, neutral_point,
+            tension_strength, tension_df, tension_air, tension_buoyed,
+            frac_init_pressure
+
+    Notes:
+        - Formulas mirror the scalar methods of CasingDataCalc exactly,
+          including the tol adjustment for casings set at max_md_depth
+        - Zero loads produce inf design factors, matching the scalar paths
+
+    Example:
+        >>> results = compute_all(wellbore.sections_dataframe(), univ_params)
+        >>> results['masp'].round(0).tolist()
+        [1129.0, 3268.0, 5732.0]
+    """
+    if isinstance(univ_params, dict):
+        univ_params = UnivParams(**univ_params)
+
+    # Pull input columns as contiguous float64 arrays
+    tvd = casings['tvd'].to_numpy(dtype=np.float64)
+    washout = casings['washout'].to_numpy(dtype=np.float64)
+    int_gradient = casings['int_gradient'].to_numpy(dtype=np.float64)
+    mud_weight = casings['mud_weight'].to_numpy(dtype=np.float64)
+    cement_cu_ft = casings['cement_cu_ft'].to_numpy(dtype=np.float64)
+    hole_size = casings['hole_size'].to_numpy(dtype=np.float64)
+    set_depth = casings['bottom'].to_numpy(dtype=np.float64)
+    csg_weight = casings['weight'].to_numpy(dtype=np.float64)
+    csg_size = casings['od'].to_numpy(dtype=np.float64)
+    csg_id = casings['csg_internal_diameter'].to_numpy(dtype=np.float64)
+    collapse_strength = casings['collapse_pressure'].to_numpy(dtype=np.float64)
+    tension_strength = casings['tension_strength'].to_numpy(dtype=np.float64)
+    burst_strength = casings['burst_strength'].to_numpy(dtype=np.float64)
+
+    # Large batches with numba available go through the thread-parallel
+    # kernel; small ones stay on the vectorized NumPy expressions below
+    if njit is not None and tvd.shape[0] >= _PARALLEL_SECTION_THRESHOLD:
+        out = np.empty((11, tvd.shape[0]))
+        _calc_all_batch(
+            tvd, washout, int_gradient, mud_weight, cement_cu_ft,
+            hole_size, set_depth, csg_weight, csg_size, csg_id,
+            collapse_strength, tension_strength, univ_params.tol,
+            univ_params.frac_gradient, univ_params.max_md_depth,
+            univ_params.max_tvd_depth, out
+        )
+        return pd.DataFrame({
+            'cement_cu_ft': cement_cu_ft,
+            'cement_height': out[2],
+            'toc': out[3],
+            'masp': out[4],
+            'collapse_strength': collapse_strength,
+            'collapse_load': out[5],
+            'collapse_df': out[6],
+            'burst_strength': burst_strength,
+            'neutral_point': out[7],
+            'tension_strength': tension_strength,
+            'tension_df': out[10],
+            'tension_air': out[8],
+            'tension_buoyed': out[9],
+            'frac_init_pressure': out[0]
+        }, index=casings.index)
+
+    # Formation fracture initiation pressure
+    frac_init_pressure = univ_params.frac_gradient * tvd
+
+    # Cement height and top of cement (washout-adjusted annular volume)
+    effective_hole = hole_size * (1 + washout / 100)
+    annular_per_foot = (
+        (effective_hole * effective_hole - csg_size * csg_size)
+        / _ANNULAR_CAPACITY_FACTOR
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cement_height = np.where(
+            csg_size > 0,
+            (1 / annular_per_foot) * cement_cu_ft,
+            0.0
+        )
+    toc = np.maximum(set_depth - cement_height, 0.0)
+
+    # Maximum anticipated surface pressure; the shared tvd factor is
+    # pulled out so the reduce works on per-foot gradients
+    masp = tvd * np.maximum(
+        np.maximum(
+            _PORE_PRESSURE_GRADIENT - int_gradient,
+            _PPG_TO_PSI_FT * mud_weight - int_gradient
+        ),
+        0.0
+    )
+
+    # Collapse load and design factor (empty casing worst case)
+    collapse_load = set_depth * mud_weight * _MUD_CONV_PSI_FT
+    collapse_df = np.divide(
+        collapse_strength, collapse_load,
+        out=np.full_like(collapse_load, np.inf),
+        where=collapse_load != 0
+    )
+
+    # Neutral point from buoyancy
+    neutral_point = tvd * (1 - mud_weight / _FRESH_WATER_EQ_PPG)
+
+    # Tension: tol-adjusted depths for casings set at max measured depth
+    at_max = set_depth == univ_params.max_md_depth
+    eff_depth = np.where(
+        at_max, np.abs(set_depth - univ_params.tol), set_depth
+    )
+    eff_tvd = np.where(
+        at_max, np.abs(tvd - univ_params.max_tvd_depth), tvd
+    )
+    tension_air = csg_weight * eff_depth * 1e-3
+    steel_area = _PI_OVER_4 * (csg_size * csg_size - csg_id * csg_id)
+    buoyancy = _PPG_TO_PSI_FT * mud_weight * eff_tvd
+    tension_buoyed = (csg_weight * eff_depth - buoyancy * steel_area) * 1e-3
+    tension_df = np.divide(
+        tension_strength, tension_buoyed,
+        out=np.full_like(tension_buoyed, np.inf),
+        where=tension_buoyed != 0
+    )
+
+    return pd.DataFrame({
+        'cement_cu_ft': cement_cu_ft,
+        'cement_height': cement_height,
+        'toc': toc,
+        'masp': masp,
+        'collapse_strength': collapse_strength,
+        'collapse_load': collapse_load,
+        'collapse_df': collapse_df,
+        'burst_strength': burst_strength,
+        'neutral_point': neutral_point,
+        'tension_strength': tension_strength,
+        'tension_df': tension_df,
+        'tension_air': tension_air,
+        'tension_buoyed': tension_buoyed,
+        'frac_init_pressure': frac_init_pressure
+    }, index=casings.index)
+
+
+@dataclass
+class CasingBatch:
+    """Structure-of-Arrays container for many casing sections at once.
+
+    Columnar counterpart to building one CasingDataCalc object per casing:
+    every input property is a contiguous float64 array and the whole result
+    battery is computed in a single vectorized pass, avoiding per-casing
+    Python objects, dict lookups and GC pressure.
+
+    Attributes:
+        tvd, washout, int_gradient, mud_weight, cement_cu_ft, hole_size,
+        bottom, weight, od, csg_internal_diameter, collapse_pressure,
+        tension_strength, burst_strength: 1-D float64 input arrays, one
+            element per casing.
+        univ_params: Wellbore-level UnivParams shared by all casings.
+        results: Result DataFrame (same columns as
+            CasingDataCalc.get_results), populated on construction.
+
+    Example:
+        >>> batch = CasingBatch.from_dataframe(casings_df, univ_params)
+        >>> batch.get_results()['masp']
+    """
+
+    tvd: np.ndarray
+    washout: np.ndarray
+    int_gradient: np.ndarray
+    mud_weight: np.ndarray
+    cement_cu_ft: np.ndarray
+    hole_size: np.ndarray
+    bottom: np.ndarray
+    weight: np.ndarray
+    od: np.ndarray
+    csg_internal_diameter: np.ndarray
+    collapse_pressure: np.ndarray
+    tension_strength: np.ndarray
+    burst_strength: np.ndarray
+    univ_params: 'UnivParams' = None
+    results: Optional[pd.DataFrame] = None
+
+    # Input columns consumed from a casing DataFrame, in field order
+    INPUT_COLUMNS = (
+        'tvd', 'washout', 'int_gradient', 'mud_weight', 'cement_cu_ft',
+        'hole_size', 'bottom', 'weight', 'od', 'csg_internal_diameter',
+        'collapse_pressure', 'tension_strength', 'burst_strength'
+    )
+
+    def __post_init__(self) -> None:
+        # Mirror CasingDataCalc: all calculations run at construction
+        if self.results is None:
+            self.calculateData()
+
+    @classmethod
+    def from_dataframe(cls, casings: pd.DataFrame,
+                       univ_params: Union['UnivParams', Dict[str, float]]
+                       ) -> 'CasingBatch':
+        """Builds a batch directly from a casing DataFrame's columns.
+
+        Args:
+            casings: DataFrame with the compute_all column contract
+                (sections_dataframe() output qualifies).
+            univ_params: Wellbore universals (UnivParams or dict).
+
+        Returns:
+            CasingBatch: Fully calculated batch over all rows.
+        """
+        if isinstance(univ_params, dict):
+            univ_params = UnivParams(**univ_params)
+        arrays = {
+            col: casings[col].to_numpy(dtype=np.float64)
+            for col in cls.INPUT_COLUMNS
+        }
+        return cls(univ_params=univ_params, **arrays)
+
+    def calculateData(self) -> None:
+        """Runs the vectorized battery over all casings in the batch."""
+        frame = pd.DataFrame({
+            col: getattr(self, col) for col in self.INPUT_COLUMNS
+        })
+        self.results = compute_all(frame, self.univ_params)
+
+    def get_results(self) -> pd.DataFrame:
+        """Returns the batch results, one row per casing."""
+        return self.results
 
 
 def main() -> None:
@@ -1349,7 +2358,7 @@ def main() -> None:
         |              18 | P-110   |      13470 |                   13620 | BTC         |             606 |         580 |  0.362 | 4.276 |
     Notes:
         - Uses pandas DataFrame operations for data manipulation
-        - Suppresses chained assignment warnings for performance
+        - Cement volumes are computed vectorized before the section loop
         - Converts string representations of lists to Python objects
         - Assumes consistent units across all input parameters
 
@@ -1357,56 +2366,90 @@ def main() -> None:
         >>> main()
         # Processes wellbore data and outputs section calculations
     """
-    # Configure pandas display and warning settings
-    pd.set_option('display.max_columns', None)  # Show all columns when displaying DataFrames
-    pd.options.mode.chained_assignment = None  # Suppress chained assignment warnings
-
-    # Database connection and data retrieval
-    conn = sqlite3.connect('sample_casing.db')
-    wb_df = pd.read_sql('SELECT * FROM wb_info', conn)
-    query = f"""select * from database"""
-    used_df = pd.read_sql(query, conn)
-    conn.close()
+    # Shared read-only connection: opened and pragma-tuned once at first
+    # use, then reused across main() invocations (see _get_connection)
+    # wb_info holds a single row of scalars - fetch it as a plain tuple
+    # rather than building a one-row DataFrame and paying .iloc per field
+    (conductor_casing_bottom, top_of_liner, max_depth_md, max_depth_tvd,
+     frac_gradient) = _get_connection().execute(
+        'SELECT conductor_casing_bottom, top_of_liner, max_depth_md,'
+        ' max_depth_tvd, frac_gradient FROM wb_info LIMIT 1'
+    ).fetchone()
+    # Project only the columns the section loop consumes; SELECT * would
+    # also ship the unused nominalweight/grade/jointtype duplicates across
+    # the DB-API boundary and allocate pandas columns for them
+    query = """
+        SELECT label, mw, tvd, hole_washout, internal_gradient, backup_mud,
+               hole_size, csg_size, set_depth, csg_weight, csg_grade,
+               csg_collar, lead_qty, lead_yield, tail_qty, tail_yield,
+               collapse, internalyieldpressure, jointstrength, bodyyield,
+               wall, id
+        FROM database
+    """
+    # The nullable backend materializes typed masked arrays instead of
+    # object-sniffed columns; the bulk float64 cast below then reuses the
+    # typed buffers rather than re-inferring from Python objects
+    used_df = pd.read_sql_query(
+        query, _get_connection(), dtype_backend='numpy_nullable'
+    )
 
     # Initialize wellbore object with basic parameters
     wellbore = WellBoreExpanded(
         name='Wellbore (Planned)',
-        top=wb_df['conductor_casing_bottom'].iloc[0],
-        bottom=wb_df['max_depth_md'].iloc[0],
+        top=conductor_casing_bottom,
+        bottom=max_depth_md,
         method='top_down',
-        tol=wb_df['top_of_liner'].iloc[0],
-        max_md_depth=wb_df['max_depth_md'].iloc[0],
-        max_tvd_depth=wb_df['max_depth_tvd'].iloc[0],
-        frac_gradient=float(wb_df['frac_gradient'].iloc[0]),
+        tol=top_of_liner,
+        max_md_depth=max_depth_md,
+        max_tvd_depth=max_depth_tvd,
+        frac_gradient=float(frac_gradient),
+    )
+    # Cast every numeric column once up front so row iteration hands out
+    # native floats straight from the float64 buffers, replacing the
+    # twenty per-row float() conversions the loop used to make
+    numeric_cols = {
+        'csg_size': 'float64', 'set_depth': 'float64',
+        'csg_weight': 'float64', 'hole_size': 'float64', 'tvd': 'float64',
+        'hole_washout': 'float64', 'internal_gradient': 'float64',
+        'mw': 'float64', 'backup_mud': 'float64', 'bodyyield': 'float64',
+        'internalyieldpressure': 'float64', 'wall': 'float64',
+        'id': 'float64', 'collapse': 'float64', 'jointstrength': 'float64',
+        'lead_qty': 'float64', 'lead_yield': 'float64',
+        'tail_qty': 'float64', 'tail_yield': 'float64',
+    }
+    used_df = used_df.astype(numeric_cols)
+
+    # Calculate cement volume from lead and tail sections in one
+    # vectorized pass instead of four scalar casts per row; eval picks the
+    # threaded numexpr engine automatically when it is installed
+    used_df['cement_cu_ft'] = used_df.eval(
+        'lead_qty * lead_yield + tail_qty * tail_yield'
+    )
+
+    # Hand every section to the wellbore in one Structure-of-Arrays call;
+    # to_numpy() views the float64 buffers created by the bulk cast above
+    wellbore.add_sections_bulk(
+        id=np.arange(len(used_df)),
+        casing_type=used_df['label'].to_numpy(),
+        od=used_df['csg_size'].to_numpy(),
+        bottom=used_df['set_depth'].to_numpy(),
+        weight=used_df['csg_weight'].to_numpy(),
+        grade=used_df['csg_grade'].to_numpy(),
+        connection=used_df['csg_collar'].to_numpy(),
+        hole_size=used_df['hole_size'].to_numpy(),
+        cement_cu_ft=used_df['cement_cu_ft'].to_numpy(),
+        tvd=used_df['tvd'].to_numpy(),
+        washout=used_df['hole_washout'].to_numpy(),
+        int_gradient=used_df['internal_gradient'].to_numpy(),
+        mud_weight=used_df['mw'].to_numpy(),
+        backup_mud=used_df['backup_mud'].to_numpy(),
+        body_yield=used_df['bodyyield'].to_numpy(),
+        burst_strength=used_df['internalyieldpressure'].to_numpy(),
+        wall_thickness=used_df['wall'].to_numpy(),
+        csg_internal_diameter=used_df['id'].to_numpy(),
+        collapse_pressure=used_df['collapse'].to_numpy(),
+        tension_strength=used_df['jointstrength'].to_numpy(),
     )
-    # Process each casing section
-    for idx, row in used_df.iterrows():
-        # Calculate cement volume from lead and tail sections
-        cement_volume = (float(row['lead_qty']) * float(row['lead_yield'])) + \
-                        (float(row['tail_qty']) * float(row['tail_yield']))
-        # Add section with comprehensive properties
-        wellbore.add_section_with_properties(
-            id=idx,
-            casing_type=row['label'],
-            od=float(row['csg_size']),
-            bottom=float(row['set_depth']),
-            weight=float(row['csg_weight']),
-            grade=row['csg_grade'],
-            connection=row['csg_collar'],
-            hole_size=float(row['hole_size']),
-            cement_cu_ft=cement_volume,
-            tvd=float(row['tvd']),
-            washout=float(row['hole_washout']),
-            int_gradient=float(row['internal_gradient']),
-            mud_weight=float(row['mw']),
-            backup_mud=float(row['backup_mud']),
-            body_yield=float(row['bodyyield']),
-            burst_strength=float(row['internalyieldpressure']),
-            wall_thickness=float(row['wall']),
-            csg_internal_diameter=float(row['id']),
-            collapse_pressure=float(row['collapse']),
-            tension_strength=float(row['jointstrength'])
-        )
 
     # Calculate final parameters for all sections
     wellbore.calcParametersContained()
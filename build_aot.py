@@ -0,0 +1,33 @@
+"""Builds the optional _casing_kernel AOT extension with numba.pycc.
+
+Usage:
+
+    python build_aot.py
+
+Ahead-of-time compilation produces a native extension that loads with no
+JIT warmup, so the first CasingDataCalc evaluation runs at full speed -
+relevant for interactive workflows where the one-off njit compile latency
+is user-visible. The extension is a pure accelerator: CasingCalcMain runs
+without it and simply uses its numba/pure-Python kernel when the import
+fails. The exported function is compiled from the same source as the
+module-level _calc_all kernel, so the two cannot drift apart.
+"""
+from numba.pycc import CC
+
+from CasingCalcMain import _calc_all
+
+cc = CC('_casing_kernel')
+
+# Unwrap the njit dispatcher back to the plain Python function when numba
+# wrapped it at import time
+_calc_all_src = getattr(_calc_all, 'py_func', _calc_all)
+
+_SIG = (
+    'UniTuple(f8, 11)'
+    '(f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)'
+)
+cc.export('calc_all', _SIG)(_calc_all_src)
+
+
+if __name__ == '__main__':
+    cc.compile()
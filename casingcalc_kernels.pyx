@@ -0,0 +1,43 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""Optional Cython build of the hot burst-math kernels.
+
+Build in place with:
+
+    python setup.py build_ext --inplace
+
+CasingCalcMain prefers these compiled kernels when the extension is
+importable and falls back to its numba/pure-Python versions otherwise.
+All three functions mirror the module-level kernels in CasingCalcMain and
+must be kept in sync with them.
+"""
+
+from libc.math cimport INFINITY
+
+DEF PPG = 0.05194806
+
+
+cpdef tuple solo_maps_burst(double mw, double bm, double tvd, double fip,
+                            double bs, double hydro_mw, double hydro_bm):
+    """Computes (maps, burst_load, burst_df) for a standalone section."""
+    cdef double maps = hydro_mw
+    cdef double part1 = PPG * (mw - bm) * tvd
+    cdef double limit = min(fip - hydro_bm, maps - hydro_bm)
+    cdef double burst_load = max(part1, limit)
+    cdef double burst_df
+    if burst_load > 0:
+        burst_df = bs / burst_load
+    else:
+        burst_df = INFINITY
+    return maps, burst_load, burst_df
+
+
+cpdef double calc_maps(double next_bhp, double tvd2, double tvd1, double ig2):
+    """Computes maximum anticipated pressure at shoe between two sections."""
+    return next_bhp - (tvd2 - tvd1) * ig2
+
+
+cpdef double calc_burst_load(double mw1, double bm1, double tvd1, double fip1,
+                             double maps, double hydro_bm):
+    """Computes the governing burst load for the upper of two sections."""
+    cdef double part1 = PPG * (mw1 - bm1) * tvd1
+    return max(part1, min(fip1 - hydro_bm, maps - hydro_bm))
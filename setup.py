@@ -0,0 +1,32 @@
+"""Builds the optional casingcalc_kernels Cython extension.
+
+Usage:
+
+    python setup.py build_ext --inplace
+
+The extension is a pure accelerator: CasingCalcMain runs without it and
+simply uses its numba/pure-Python kernels when the import fails.
+"""
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+extensions = [
+    Extension(
+        "casingcalc_kernels",
+        ["casingcalc_kernels.pyx"],
+        # -ffp-contract=fast lets the compiler fuse the sum-of-products
+        # pressure arithmetic into FMA instructions; -march=native is safe
+        # because the extension is only ever built in place on the host
+        extra_compile_args=[
+            "-O3",
+            "-ffast-math",
+            "-ffp-contract=fast",
+            "-march=native",
+        ],
+    )
+]
+
+setup(
+    name="casingcalc-kernels",
+    ext_modules=cythonize(extensions, language_level=3),
+)